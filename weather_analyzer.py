@@ -2,7 +2,86 @@ import pandas as pd
 import numpy as np
 import os
 import glob
+import json
+import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Above this many records the per-station statistics use the fused numba kernel
+NUMBA_ROW_THRESHOLD = 1_000_000
+
+# Cell values treated as missing temperatures when parsing the CSV files
+NA_VALUES = ['', '-', 'NA', '-9999']
+
+# Long-format data cache kept inside the data folder, plus the key it was built from.
+# Bump CACHE_VERSION whenever a code change alters how the CSV files are parsed.
+CACHE_FILENAME = ".weather_cache.parquet"
+CACHE_KEY_FILENAME = ".weather_cache.json"
+CACHE_VERSION = 2
+
+
+def _station_reduce(codes, temps, n_groups):
+    """
+    Compute per-station min, max, mean, sample std and count in a single pass
+    
+    Uses Welford's algorithm so the variance is accumulated without a second
+    read of the temperature array.
+    
+    Args:
+        codes (np.ndarray): Integer station code for each record
+        temps (np.ndarray): Temperature for each record
+        n_groups (int): Number of stations (categories)
+    
+    Returns:
+        tuple: Arrays of min, max, mean, std, count and first-seen record
+            position, indexed by station code
+    """
+    mn = np.full(n_groups, np.inf, np.float32)
+    mx = np.full(n_groups, -np.inf, np.float32)
+    mean = np.zeros(n_groups, np.float64)
+    m2 = np.zeros(n_groups, np.float64)
+    count = np.zeros(n_groups, np.int64)
+    first = np.full(n_groups, -1, np.int64)
+    
+    for i in range(len(codes)):
+        g = codes[i]
+        v = temps[i]
+        if first[g] < 0:
+            first[g] = i
+        if v < mn[g]:
+            mn[g] = v
+        if v > mx[g]:
+            mx[g] = v
+        count[g] += 1
+        delta = v - mean[g]
+        mean[g] += delta / count[g]
+        m2[g] += delta * (v - mean[g])
+    
+    std = np.full(n_groups, np.nan, np.float64)
+    for g in range(n_groups):
+        if count[g] > 1:
+            std[g] = np.sqrt(m2[g] / (count[g] - 1))
+    
+    return mn, mx, mean, std, count, first
+
+
+_station_reduce_jit = None
+
+
+def _jit_station_reduce():
+    """Return the numba-compiled _station_reduce, or None if numba is not installed"""
+    global _station_reduce_jit
+    if _station_reduce_jit is None:
+        try:
+            # Imported lazily: numba is optional and slow to import
+            from numba import njit
+        except ImportError:
+            return None
+        _station_reduce_jit = njit(cache=True)(_station_reduce)
+    return _station_reduce_jit
+
 
 class WeatherAnalyzer:
     def __init__(self, data_folder="temperatures"):
@@ -14,142 +93,302 @@ class WeatherAnalyzer:
         """
         self.data_folder = data_folder
         self.all_data = pd.DataFrame()
+        self._station_stats = None
+        self._summary = {}
+        self._years_sorted = np.array([], dtype=np.int16)
+        self._years_min = self._years_max = None
         self.season_mapping = {
             'December': 'Summer', 'January': 'Summer', 'February': 'Summer',
             'March': 'Autumn', 'April': 'Autumn', 'May': 'Autumn',
             'June': 'Winter', 'July': 'Winter', 'August': 'Winter',
             'September': 'Spring', 'October': 'Spring', 'November': 'Spring'
         }
+        self.month_order = ['January', 'February', 'March', 'April', 'May', 'June',
+                            'July', 'August', 'September', 'October', 'November', 'December']
+        self.season_order = ['Summer', 'Autumn', 'Winter', 'Spring']
+        # Season code (position in season_order) for each month, indexed by month code
+        self._season_code_by_month = np.array(
+            [self.season_order.index(self.season_mapping[m]) for m in self.month_order], dtype=np.int8)
         
     def load_all_data(self):
         """Load and combine all CSV files from the temperatures folder"""
-        print(f"Loading monthly temperature data from {self.data_folder} folder...")
+        logger.info("Loading monthly temperature data from %s folder...", self.data_folder)
         
         # Get all CSV files in the temperatures folder
         csv_pattern = os.path.join(self.data_folder, "*.csv")
-        csv_files = glob.glob(csv_pattern)
+        csv_files = sorted(glob.glob(csv_pattern))
         
         if not csv_files:
             raise FileNotFoundError(f"No CSV files found in {self.data_folder} folder")
         
-        all_dataframes = []
+        # Reuse the cached long-format data if neither the CSV files nor the
+        # parsing rules have changed since it was written
+        cache_key = self._cache_key(csv_files)
+        cached = self._read_cache(cache_key)
+        if cached is not None:
+            self.all_data = cached
+            logger.info("Data loading complete: %s records read from cache", f"{len(self.all_data):,}")
+        else:
+            self.all_data = self._parse_csv_files(csv_files)
+            self._write_cache(cache_key)
         
-        for file_path in csv_files:
-            print(f"Processing {os.path.basename(file_path)}...")
-            try:
-                # Extract year from filename
-                filename = os.path.basename(file_path)
-                # Try to extract year from filename like "stations_group_1990.csv"
-                try:
-                    year = int(filename.split('_')[-1].replace('.csv', ''))
-                except:
-                    print(f"Warning: Could not extract year from {filename}, skipping...")
-                    continue
-                
-                # Read CSV file
-                df = pd.read_csv(file_path)
-                
-                print(f"  Columns found: {list(df.columns)}")
-                print(f"  Number of stations: {len(df)}")
-                
-                # Check for required columns
-                station_col = None
-                if 'STATION_NAME' in df.columns:
-                    station_col = 'STATION_NAME'
-                elif 'Station' in df.columns:
-                    station_col = 'Station'
-                elif 'station' in df.columns:
-                    station_col = 'station'
-                else:
-                    print(f"  Warning: No station name column found, skipping...")
-                    continue
-                
-                # Define month columns
-                month_columns = ['January', 'February', 'March', 'April', 'May', 'June',
-                               'July', 'August', 'September', 'October', 'November', 'December']
-                
-                # Check which month columns exist
-                available_months = [col for col in month_columns if col in df.columns]
-                
-                if not available_months:
-                    print(f"  Warning: No month columns found, skipping...")
-                    continue
-                
-                print(f"  Available months: {available_months}")
-                
-                # Reshape data from wide to long format
-                # Create a list to store all temperature records
-                records = []
-                
-                for _, row in df.iterrows():
-                    station_name = row[station_col]
-                    
-                    for month in available_months:
-                        temp_value = row[month]
-                        
-                        # Skip if temperature is NaN or invalid
-                        if pd.isna(temp_value):
-                            continue
-                        
-                        # Convert to numeric
-                        try:
-                            temp_numeric = float(temp_value)
-                        except:
-                            continue
-                        
-                        # Create a record for this station-month-year combination
-                        records.append({
-                            'Station': station_name,
-                            'Year': year,
-                            'Month': month,
-                            'Temperature': temp_numeric,
-                            'Season': self.season_mapping[month]
-                        })
-                
-                if records:
-                    df_reshaped = pd.DataFrame(records)
-                    all_dataframes.append(df_reshaped)
-                    print(f"  Successfully processed {len(records)} temperature records")
-                else:
-                    print(f"  No valid temperature data found")
-                    
-            except Exception as e:
-                print(f"Error processing {file_path}: {str(e)}")
-                continue
+        # Per-station statistics shared by the range and stability analyses
+        self._station_stats = self._compute_station_stats()
+        
+        # Overall summary scalars, computed once with numpy on the contiguous
+        # temperature array (sample std, ddof=1, to match pandas' Series.std)
+        t = self.all_data['Temperature'].to_numpy()
+        self._summary.update(
+            tmin=float(t.min()),
+            tmax=float(t.max()),
+            tmean=float(np.mean(t, dtype=np.float64)),
+            tstd=float(np.std(t, dtype=np.float64, ddof=1)),
+            # Station categories are exactly the distinct station names
+            n_stations=len(self.all_data['Station'].cat.categories)
+        )
+        summary = self._summary
+        
+        # Sorted distinct years (np.unique sorts, so no separate sort is needed)
+        self._years_sorted = np.unique(self.all_data['Year'].to_numpy())
+        self._years_min, self._years_max = self._years_sorted[0], self._years_sorted[-1]
+        
+        logger.info("Unique stations: %d", summary['n_stations'])
+        logger.info("Years covered: %s", self._years_sorted.tolist())
+        logger.info("Temperature range: %.1f°C to %.1f°C", summary['tmin'], summary['tmax'])
+        
+        # Show some sample data
+        logger.debug("Sample data:\n%s", self.all_data.head(10))
+        
+    def _parse_csv_files(self, csv_files):
+        """
+        Parse all CSV files and combine them into one long-format DataFrame
+        
+        Args:
+            csv_files (list): Paths of the CSV files to parse
+        
+        Returns:
+            pd.DataFrame: Combined temperature records with compact dtypes
+        """
+        # Parse files concurrently (logging is thread-safe, so workers log directly)
+        max_workers = min(os.cpu_count() or 1, len(csv_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            all_dataframes = [df for df in executor.map(self._process_one, csv_files)
+                              if df is not None]
         
         if not all_dataframes:
             raise ValueError("No valid data files could be processed")
         
         # Combine all dataframes
-        self.all_data = pd.concat(all_dataframes, ignore_index=True)
+        all_data = pd.concat(all_dataframes, ignore_index=True)
         
-        print(f"\nData loading complete!")
-        print(f"Total temperature records: {len(self.all_data):,}")
-        print(f"Unique stations: {self.all_data['Station'].nunique()}")
-        print(f"Years covered: {sorted(self.all_data['Year'].unique())}")
-        print(f"Temperature range: {self.all_data['Temperature'].min():.1f}°C to {self.all_data['Temperature'].max():.1f}°C")
+        # Month and Season are already categoricals; convert Station and downcast numerics
+        all_data['Station'] = all_data['Station'].astype('category')
+        all_data['Temperature'] = all_data['Temperature'].astype('float32')
+        all_data['Year'] = all_data['Year'].astype('int16')
         
-        # Show some sample data
-        print(f"\nSample data:")
-        print(self.all_data.head(10))
+        logger.info("Data loading complete: %d of %d files loaded (%d skipped), %s records",
+                    len(all_dataframes), len(csv_files), len(csv_files) - len(all_dataframes),
+                    f"{len(all_data):,}")
+        return all_data
+    
+    def _cache_key(self, csv_files):
+        """Build the cache key from the parsing rules and each CSV file's name and mtime"""
+        return {
+            'version': CACHE_VERSION,
+            'na_values': NA_VALUES,
+            'month_order': self.month_order,
+            'season_mapping': self.season_mapping,
+            'files': [[os.path.basename(p), os.stat(p).st_mtime_ns] for p in sorted(csv_files)],
+        }
+    
+    def _has_expected_dtypes(self, data):
+        """Check that cached data has the columns and dtypes _parse_csv_files produces"""
+        if list(data.columns) != ['Station', 'Year', 'Month', 'Temperature', 'Season']:
+            return False
+        return (isinstance(data['Station'].dtype, pd.CategoricalDtype)
+                and data['Year'].dtype == np.int16
+                and data['Month'].dtype == pd.CategoricalDtype(self.month_order, ordered=True)
+                and data['Temperature'].dtype == np.float32
+                and data['Season'].dtype == pd.CategoricalDtype(self.season_order, ordered=True))
+    
+    def _read_cache(self, cache_key):
+        """Return the cached long-format data if it was built with the same key, else None"""
+        cache = Path(self.data_folder) / CACHE_FILENAME
+        key_file = Path(self.data_folder) / CACHE_KEY_FILENAME
+        try:
+            if not cache.exists() or json.loads(key_file.read_text()) != cache_key:
+                return None
+            data = pd.read_parquet(cache, engine='pyarrow')
+        except (OSError, ValueError, ImportError) as e:
+            logger.debug("Ignoring unreadable cache %s: %s", cache, e)
+            return None
         
+        if not self._has_expected_dtypes(data):
+            logger.debug("Ignoring cache %s with unexpected columns or dtypes", cache)
+            return None
+        return data
+    
+    def _write_cache(self, cache_key):
+        """Save self.all_data as Parquet so later runs can skip parsing the CSV files"""
+        cache = Path(self.data_folder) / CACHE_FILENAME
+        key_file = Path(self.data_folder) / CACHE_KEY_FILENAME
+        try:
+            self.all_data.to_parquet(cache, engine='pyarrow', compression='zstd')
+            key_file.write_text(json.dumps(cache_key))
+        except Exception as e:
+            # Caching is only an optimisation; any failure (I/O, missing pyarrow or
+            # zstd codec, Arrow conversion errors) just means running without it
+            logger.debug("Could not write cache %s: %s", cache, e)
+    
+    def _process_one(self, file_path):
+        """
+        Read one CSV file and reshape it into long-format temperature records
+        
+        Args:
+            file_path (str): Path to the CSV file
+        
+        Returns:
+            pd.DataFrame or None: The file's records, or None if it could not be used
+        """
+        # Extract year from filename
+        filename = os.path.basename(file_path)
+        logger.debug("Processing %s...", filename)
+        try:
+            # Try to extract year from filename like "stations_group_1990.csv"
+            try:
+                year = int(filename.split('_')[-1].replace('.csv', ''))
+            except:
+                logger.warning("Could not extract year from %s, skipping...", filename)
+                return None
+            
+            # Read only the header first so the full parse can skip unused columns
+            columns = pd.read_csv(file_path, nrows=0).columns
+            
+            logger.debug("%s: columns found: %s", filename, list(columns))
+            
+            # Check for required columns
+            station_col = None
+            if 'STATION_NAME' in columns:
+                station_col = 'STATION_NAME'
+            elif 'Station' in columns:
+                station_col = 'Station'
+            elif 'station' in columns:
+                station_col = 'station'
+            else:
+                logger.warning("%s: no station name column found, skipping...", filename)
+                return None
+            
+            # Check which month columns exist
+            available_months = [col for col in self.month_order if col in columns]
+            
+            if not available_months:
+                logger.warning("%s: no month columns found, skipping...", filename)
+                return None
+            
+            logger.debug("%s: available months: %s", filename, available_months)
+            
+            # Read CSV file, parsing only the needed columns with explicit dtypes
+            usecols = [station_col] + available_months
+            dtype = {station_col: 'string', **dict.fromkeys(available_months, 'float32')}
+            try:
+                df = self._read_csv(file_path, usecols, dtype)
+            except ValueError:
+                # Some month values are neither numbers nor known missing markers;
+                # read without dtype hints and let pd.to_numeric coerce them below
+                df = self._read_csv(file_path, usecols)
+            
+            logger.debug("%s: number of stations: %d", filename, len(df))
+            
+            # Convert month columns to numeric (invalid values become NaN) and
+            # drop stations without a single reading before reshaping.
+            # Cast to numpy float64 so coerced values on Arrow-backed columns
+            # are treated as missing by dropna.
+            for month in available_months:
+                df[month] = pd.to_numeric(df[month], errors='coerce').astype('float64')
+            df = df.dropna(subset=available_months, how='all')
+            
+            # Reshape data from wide to long format by building each column
+            # array directly (month-major, one block of stations per month)
+            n_stations = len(df)
+            month_codes = np.array([self.month_order.index(m) for m in available_months], dtype=np.int8)
+            temps = df[available_months].to_numpy(np.float64).ravel(order='F')
+            month_codes = np.repeat(month_codes, n_stations)
+            stations = np.tile(df[station_col].to_numpy(dtype=object), len(available_months))
+            
+            # Skip NaN or invalid temperatures
+            valid = ~np.isnan(temps)
+            month_codes = month_codes[valid]
+            
+            # Month is an ordered categorical built from its codes, and Season codes
+            # are gathered from the same codes without any string hashing
+            df_long = pd.DataFrame({
+                'Station': stations[valid],
+                'Year': year,
+                'Month': pd.Categorical.from_codes(month_codes, categories=self.month_order, ordered=True),
+                'Temperature': temps[valid],
+                'Season': pd.Categorical.from_codes(np.take(self._season_code_by_month, month_codes),
+                                                    categories=self.season_order, ordered=True),
+            })
+            
+            if not df_long.empty:
+                logger.debug("%s: successfully processed %d temperature records", filename, len(df_long))
+                return df_long
+            else:
+                logger.warning("%s: no valid temperature data found", filename)
+                return None
+                
+        except Exception as e:
+            logger.error("Error processing %s: %s", file_path, e)
+            return None
+    
+    def _read_csv(self, file_path, usecols, dtype=None):
+        """Read the given columns of a CSV file, using the pyarrow parser when available"""
+        kwargs = dict(usecols=usecols, dtype=dtype, na_values=NA_VALUES)
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', dtype_backend='pyarrow', **kwargs)
+        except ImportError:
+            # pyarrow is not installed, fall back to the default C parser
+            return pd.read_csv(file_path, **kwargs)
+    
+    def _compute_station_stats(self):
+        """Compute min, max, std, count and range for every station in one grouped pass"""
+        kernel = _jit_station_reduce() if len(self.all_data) > NUMBA_ROW_THRESHOLD else None
+        if kernel is not None:
+            # Large inputs: fused single-pass kernel over the categorical codes
+            station = self.all_data['Station']
+            codes = station.cat.codes.to_numpy(np.int32)
+            temps = self.all_data['Temperature'].to_numpy(np.float32)
+            mn, mx, _, std, count, first = kernel(codes, temps, len(station.cat.categories))
+            
+            # Match the groupby result: observed stations only, in first-seen
+            # order, on a CategoricalIndex, with std in the Temperature dtype
+            present = np.flatnonzero(count > 0)
+            order = present[np.argsort(first[present], kind='stable')]
+            index = pd.CategoricalIndex(pd.Categorical.from_codes(order, dtype=station.dtype),
+                                        name='Station')
+            stats = pd.DataFrame({'min': mn[order], 'max': mx[order],
+                                  'std': std[order].astype(self.all_data['Temperature'].dtype),
+                                  'count': count[order]},
+                                 index=index)
+        else:
+            gb = self.all_data.groupby('Station', sort=False, observed=True)['Temperature']
+            stats = gb.agg(['min', 'max', 'std', 'count'])
+        stats['Range'] = stats['max'] - stats['min']
+        return stats
+    
     def calculate_seasonal_averages(self):
         """Calculate average temperature for each season across all stations and years"""
         print("\nCalculating seasonal averages...")
         
         # Group by season and calculate mean temperature
-        seasonal_avg = self.all_data.groupby('Season')['Temperature'].mean()
-        
-        # Order seasons logically (Summer, Autumn, Winter, Spring)
-        season_order = ['Summer', 'Autumn', 'Winter', 'Spring']
-        seasonal_avg = seasonal_avg.reindex(season_order)
+        # (Season is an ordered categorical, so results come out as Summer, Autumn, Winter, Spring)
+        seasonal_avg = self.all_data.groupby('Season', observed=False)['Temperature'].mean()
         
-        # Save to file
+        # Build the report in memory and save to file with a single write
+        lines = ["Seasonal Average Temperatures (All Stations, All Years)", "=" * 55]
+        lines += [f"{season}: {temp:.1f}°C" for season, temp in seasonal_avg.items()]
         with open('average_temp.txt', 'w') as f:
-            f.write("Seasonal Average Temperatures (All Stations, All Years)\n")
-            f.write("=" * 55 + "\n")
-            for season, temp in seasonal_avg.items():
-                f.write(f"{season}: {temp:.1f}°C\n")
+            f.write("\n".join(lines) + "\n")
         
         print("Seasonal averages saved to 'average_temp.txt'")
         return seasonal_avg
@@ -158,24 +397,27 @@ class WeatherAnalyzer:
         """Find station(s) with the largest temperature range"""
         print("\nCalculating temperature ranges by station...")
         
-        # Group by station and calculate min, max, and range
-        station_stats = self.all_data.groupby('Station')['Temperature'].agg(['min', 'max']).reset_index()
-        station_stats['Range'] = station_stats['max'] - station_stats['min']
+        # Min, max, and range per station (computed once in load_all_data)
+        station_stats = self._station_stats
         
-        # Sort by range to see the results
-        station_stats = station_stats.sort_values('Range', ascending=False)
+        # Find the maximum range, keeping every station tied at that value
+        # (ties listed alphabetically, independent of file order)
+        ranges = station_stats['Range'].to_numpy()
+        idx = np.flatnonzero(ranges == ranges.max())
+        stations_with_max_range = (station_stats.iloc[idx][['min', 'max', 'Range']]
+                                   .reset_index()
+                                   .sort_values('Station', ignore_index=True))
         
-        # Find the maximum range
-        max_range = station_stats['Range'].max()
-        stations_with_max_range = station_stats[station_stats['Range'] == max_range]
+        # Format one line per station without iterating rows
+        station_lines = ("Station " + stations_with_max_range['Station'].astype(str)
+                         + ": Range " + stations_with_max_range['Range'].map('{:.1f}'.format)
+                         + "°C (Max: " + stations_with_max_range['max'].map('{:.1f}'.format)
+                         + "°C, Min: " + stations_with_max_range['min'].map('{:.1f}'.format) + "°C)")
         
-        # Save to file
+        # Build the report in memory and save to file with a single write
+        lines = ["Station(s) with Largest Temperature Range", "=" * 40, *station_lines]
         with open('largest_temp_range_station.txt', 'w') as f:
-            f.write("Station(s) with Largest Temperature Range\n")
-            f.write("=" * 40 + "\n")
-            for _, row in stations_with_max_range.iterrows():
-                f.write(f"Station {row['Station']}: Range {row['Range']:.1f}°C "
-                       f"(Max: {row['max']:.1f}°C, Min: {row['min']:.1f}°C)\n")
+            f.write("\n".join(lines) + "\n")
         
         print(f"Temperature range analysis saved to 'largest_temp_range_station.txt'")
         return stations_with_max_range
@@ -184,9 +426,8 @@ class WeatherAnalyzer:
         """Find stations with most stable and most variable temperatures"""
         print("\nAnalyzing temperature stability...")
         
-        # Calculate standard deviation for each station
-        station_std = self.all_data.groupby('Station')['Temperature'].std().reset_index()
-        station_std.columns = ['Station', 'StdDev']
+        # Standard deviation for each station (computed once in load_all_data)
+        station_std = self._station_stats['std'].rename('StdDev').reset_index()
         
         # Remove stations with NaN std dev (only one data point)
         station_std = station_std.dropna()
@@ -196,24 +437,23 @@ class WeatherAnalyzer:
             return None, None
         
         # Find most stable (minimum std dev) and most variable (maximum std dev)
-        min_std = station_std['StdDev'].min()
-        max_std = station_std['StdDev'].max()
+        std = station_std['StdDev'].to_numpy()
+        # (ties listed alphabetically, independent of file order)
+        most_stable = station_std.iloc[np.flatnonzero(std == std.min())].sort_values('Station')
+        most_variable = station_std.iloc[np.flatnonzero(std == std.max())].sort_values('Station')
         
-        most_stable = station_std[station_std['StdDev'] == min_std]
-        most_variable = station_std[station_std['StdDev'] == max_std]
+        # Format one line per station without iterating rows
+        stable_lines = ("Most Stable: Station " + most_stable['Station'].astype(str)
+                        + ": StdDev " + most_stable['StdDev'].map('{:.1f}'.format) + "°C")
+        variable_lines = ("Most Variable: Station " + most_variable['Station'].astype(str)
+                          + ": StdDev " + most_variable['StdDev'].map('{:.1f}'.format) + "°C")
         
-        # Save to file
+        # Build the report in memory and save to file with a single write
+        lines = ["Temperature Stability Analysis", "=" * 30, ""]
+        lines += ["Most Stable Station(s):", *stable_lines, ""]
+        lines += ["Most Variable Station(s):", *variable_lines]
         with open('temperature_stability_stations.txt', 'w') as f:
-            f.write("Temperature Stability Analysis\n")
-            f.write("=" * 30 + "\n\n")
-            
-            f.write("Most Stable Station(s):\n")
-            for _, row in most_stable.iterrows():
-                f.write(f"Most Stable: Station {row['Station']}: StdDev {row['StdDev']:.1f}°C\n")
-            
-            f.write("\nMost Variable Station(s):\n")
-            for _, row in most_variable.iterrows():
-                f.write(f"Most Variable: Station {row['Station']}: StdDev {row['StdDev']:.1f}°C\n")
+            f.write("\n".join(lines) + "\n")
         
         print("Temperature stability analysis saved to 'temperature_stability_stations.txt'")
         return most_stable, most_variable
@@ -222,42 +462,45 @@ class WeatherAnalyzer:
         """Generate a comprehensive summary report"""
         print("\nGenerating summary report...")
         
+        # Scalars computed once in load_all_data
+        summary = self._summary
+        
+        # Build the report in memory and save to file with a single write
+        lines = ["AUSTRALIAN WEATHER STATION TEMPERATURE ANALYSIS SUMMARY", "=" * 55, ""]
+        
+        lines += [
+            f"Analysis Period: {self._years_min} to {self._years_max}",
+            f"Total Records Analyzed: {len(self.all_data):,}",
+            f"Number of Weather Stations: {summary['n_stations']}",
+            f"Years Covered: {self._years_sorted.tolist()}",
+            "",
+        ]
+        
+        # Overall statistics
+        lines += [
+            "OVERALL TEMPERATURE STATISTICS",
+            "-" * 30,
+            f"Overall Mean Temperature: {summary['tmean']:.1f}°C",
+            f"Overall Standard Deviation: {summary['tstd']:.1f}°C",
+            f"Absolute Maximum: {summary['tmax']:.1f}°C",
+            f"Absolute Minimum: {summary['tmin']:.1f}°C",
+            f"Overall Range: {summary['tmax'] - summary['tmin']:.1f}°C",
+            "",
+        ]
+        
+        # Monthly statistics
+        lines += ["MONTHLY AVERAGE TEMPERATURES", "-" * 28]
+        monthly_avg = self.all_data.groupby('Month', observed=False)['Temperature'].mean()
+        lines += [f"{month:>10}: {temp:.1f}°C" for month, temp in monthly_avg.items()]
+        lines.append("")
+        
+        # Station list
+        lines += ["WEATHER STATIONS INCLUDED", "-" * 25]
+        stations = self.all_data['Station'].cat.categories.sort_values()
+        lines += [f"{i:2d}. {station}" for i, station in enumerate(stations, 1)]
+        
         with open('analysis_summary.txt', 'w') as f:
-            f.write("AUSTRALIAN WEATHER STATION TEMPERATURE ANALYSIS SUMMARY\n")
-            f.write("=" * 55 + "\n\n")
-            
-            f.write(f"Analysis Period: {self.all_data['Year'].min()} to {self.all_data['Year'].max()}\n")
-            f.write(f"Total Records Analyzed: {len(self.all_data):,}\n")
-            f.write(f"Number of Weather Stations: {self.all_data['Station'].nunique()}\n")
-            f.write(f"Years Covered: {sorted(self.all_data['Year'].unique())}\n\n")
-            
-            # Overall statistics
-            f.write("OVERALL TEMPERATURE STATISTICS\n")
-            f.write("-" * 30 + "\n")
-            f.write(f"Overall Mean Temperature: {self.all_data['Temperature'].mean():.1f}°C\n")
-            f.write(f"Overall Standard Deviation: {self.all_data['Temperature'].std():.1f}°C\n")
-            f.write(f"Absolute Maximum: {self.all_data['Temperature'].max():.1f}°C\n")
-            f.write(f"Absolute Minimum: {self.all_data['Temperature'].min():.1f}°C\n")
-            f.write(f"Overall Range: {self.all_data['Temperature'].max() - self.all_data['Temperature'].min():.1f}°C\n\n")
-            
-            # Monthly statistics
-            f.write("MONTHLY AVERAGE TEMPERATURES\n")
-            f.write("-" * 28 + "\n")
-            monthly_avg = self.all_data.groupby('Month')['Temperature'].mean()
-            month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            monthly_avg = monthly_avg.reindex(month_order)
-            for month, temp in monthly_avg.items():
-                f.write(f"{month:>10}: {temp:.1f}°C\n")
-            
-            f.write("\n")
-            
-            # Station list
-            f.write("WEATHER STATIONS INCLUDED\n")
-            f.write("-" * 25 + "\n")
-            stations = sorted(self.all_data['Station'].unique())
-            for i, station in enumerate(stations, 1):
-                f.write(f"{i:2d}. {station}\n")
+            f.write("\n".join(lines) + "\n")
         
         print("Summary report saved to 'analysis_summary.txt'")
     
@@ -296,17 +539,17 @@ class WeatherAnalyzer:
                 print(f"  {season}: {temp:.1f}°C")
             
             print(f"\nLargest Temperature Range:")
-            for _, row in temp_ranges.iterrows():
-                print(f"  Station {row['Station']}: {row['Range']:.1f}°C")
+            for row in temp_ranges.itertuples(index=False):
+                print(f"  Station {row.Station}: {row.Range:.1f}°C")
                 
             if stable_stations is not None and variable_stations is not None:
                 print(f"\nMost Stable Station:")
-                for _, row in stable_stations.iterrows():
-                    print(f"  Station {row['Station']}: StdDev {row['StdDev']:.1f}°C")
+                for row in stable_stations.itertuples(index=False):
+                    print(f"  Station {row.Station}: StdDev {row.StdDev:.1f}°C")
                     
                 print(f"\nMost Variable Station:")
-                for _, row in variable_stations.iterrows():
-                    print(f"  Station {row['Station']}: StdDev {row['StdDev']:.1f}°C")
+                for row in variable_stations.itertuples(index=False):
+                    print(f"  Station {row.Station}: StdDev {row.StdDev:.1f}°C")
                 
         except Exception as e:
             print(f"\nError during analysis: {str(e)}")
@@ -316,8 +559,16 @@ class WeatherAnalyzer:
             print("3. CSV files contain columns: STATION_NAME and monthly temperature columns")
 
 
-def main():
-    """Main function to run the weather analysis"""
+def main(log_level=logging.INFO):
+    """
+    Main function to run the weather analysis
+    
+    Args:
+        log_level (int): Logging level for data loading messages
+            (use logging.DEBUG to see per-file details)
+    """
+    logging.basicConfig(level=log_level, format="%(message)s")
+    
     # Create analyzer instance
     analyzer = WeatherAnalyzer()
     